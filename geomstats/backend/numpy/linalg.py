@@ -10,6 +10,7 @@ from autograd.numpy.linalg import (  # NOQA
     inv,
     norm,
     matrix_rank,
+    solve,
     svd
 )
 
@@ -21,6 +21,10 @@ def inv(*args, **kwargs):
     return torch.from_numpy(np.linalg.inv(*args, **kwargs))
 
 
+def solve(*args, **kwargs):
+    return torch.from_numpy(np.linalg.solve(*args, **kwargs))
+
+
 def eigvalsh(*args, **kwargs):
     return torch.from_numpy(np.linalg.eigvalsh(*args, **kwargs))
 
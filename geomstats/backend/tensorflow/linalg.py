@@ -55,6 +55,16 @@ def inv(x):
     return tf.linalg.inv(x)
 
 
+def solve(matrix, rhs):
+    batch_shape = tf.broadcast_dynamic_shape(
+        tf.shape(matrix)[:-2], tf.shape(rhs)[:-2])
+    matrix = tf.broadcast_to(
+        matrix, tf.concat([batch_shape, tf.shape(matrix)[-2:]], axis=0))
+    rhs = tf.broadcast_to(
+        rhs, tf.concat([batch_shape, tf.shape(rhs)[-2:]], axis=0))
+    return tf.linalg.solve(matrix, rhs)
+
+
 def matrix_rank(x):
     return tf.rank(x)
 
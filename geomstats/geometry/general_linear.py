@@ -59,12 +59,29 @@ class GeneralLinear(Matrices):
             The left multiplication of `exp(algebra_mat)` with
             `base_point`.
         """
-        expm = gs.linalg.expm
         if base_point is None:
-            return expm(tangent_vec)
-        else:
-            lie_algebra_vec = cls.mul(cls.inv(base_point), tangent_vec)
-            return cls.mul(base_point, cls.exp(lie_algebra_vec))
+            return cls._exp_from_algebra(tangent_vec)
+        lie_algebra_vec = gs.linalg.solve(base_point, tangent_vec)
+        return cls._exp_from_algebra(lie_algebra_vec, base_point)
+
+    @classmethod
+    def _exp_from_algebra(cls, lie_algebra_vec, base_point=None):
+        """Left-translate the exponential of a Lie algebra element.
+
+        Parameters
+        ----------
+        lie_algebra_vec :   array-like, shape=[..., n, n]
+        base_point :        array-like, shape=[..., n, n]
+            Defaults to identity.
+
+        Returns
+        -------
+        point :             array-like, shape=[..., n, n]
+        """
+        exp = gs.linalg.expm(lie_algebra_vec)
+        if base_point is None:
+            return exp
+        return cls.mul(base_point, exp)
 
     @classmethod
     def log(cls, point, base_point=None):
@@ -94,12 +111,10 @@ class GeneralLinear(Matrices):
 
             g = \exp(\log(g, h), h)
         """
-        logm = gs.linalg.logm
         if base_point is None:
-            return logm(point)
-        else:
-            lie_algebra_vec = logm(cls.mul(cls.inv(base_point), point))
-            return cls.mul(base_point, lie_algebra_vec)
+            return gs.linalg.logm(point)
+        lie_algebra_vec = gs.linalg.logm(gs.linalg.solve(base_point, point))
+        return cls.mul(base_point, lie_algebra_vec)
 
     @classmethod
     def orbit(cls, point, base_point=None):
@@ -136,13 +151,43 @@ class GeneralLinear(Matrices):
         Vectorization
         -------------
         Return a collection of trajectories (4-D array)
-        from a collection of input matrices (3-D array).
+        from a collection of input matrices (3-D array), when all the Lie
+        algebra elements :math:`X` are exactly symmetric, e.g. for
+        diagonal points and base points. Otherwise,
+        point and base_point must be single matrices (2-D arrays).
 
-        # TODO(nina): Will work when expm gets properly 4-D vectorized.
+        # TODO(nina): Vectorize the non-symmetric case when expm gets
+        # properly 4-D vectorized.
         """
-        tangent_vec = cls.log(point, base_point)
+        if base_point is None:
+            lie_algebra_vec = gs.linalg.logm(point)
+        else:
+            lie_algebra_vec = gs.linalg.logm(
+                gs.linalg.solve(base_point, point))
+
+        if gs.all(lie_algebra_vec == cls.transpose(lie_algebra_vec)):
+            # Diagonalize once: exp(t X) = V exp(t D) V^T for all times.
+            # Only exactly symmetric X qualify, as eigh reads one triangle.
+            eigvals, eigvecs = gs.linalg.eigh(lie_algebra_vec)
+
+            def path(time):
+                exp_eigvals = gs.exp(
+                    gs.reshape(time, (-1, 1)) * gs.expand_dims(eigvals, -2))
+                # Scale the eigenvectors first, so that the contraction
+                # reduces to a single batched matrix product.
+                scaled_eigvecs = gs.expand_dims(eigvecs, -3) * gs.expand_dims(
+                    exp_eigvals, -2)
+                exp = cls.mul(
+                    scaled_eigvecs, gs.expand_dims(cls.transpose(eigvecs), -3))
+                if base_point is None:
+                    return exp
+                if gs.ndim(base_point) == 3:
+                    return cls.mul(gs.expand_dims(base_point, -3), exp)
+                return cls.mul(base_point, exp)
+            return path
 
         def path(time):
-            vecs = gs.einsum('t,...ij->...tij', time, tangent_vec)
-            return cls.exp(vecs, base_point)
+            vecs = gs.reshape(time, (-1, 1, 1)) * gs.expand_dims(
+                lie_algebra_vec, -3)
+            return cls._exp_from_algebra(vecs, base_point)
         return path
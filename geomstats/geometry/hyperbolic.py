@@ -5,7 +5,6 @@ The n-dimensional hyperbolic space embedded and its different representations.
 
 import math
 
-
 import geomstats.backend as gs
 from geomstats.geometry.embedded_manifold import EmbeddedManifold
 from geomstats.geometry.minkowski import Minkowski
@@ -14,28 +13,60 @@ from geomstats.geometry.riemannian_metric import RiemannianMetric
 
 TOLERANCE = 1e-6
 
-SINH_TAYLOR_COEFFS = [0., 1.,
-                      0., 1 / math.factorial(3),
-                      0., 1 / math.factorial(5),
-                      0., 1 / math.factorial(7),
-                      0., 1 / math.factorial(9)]
-COSH_TAYLOR_COEFFS = [1., 0.,
-                      1 / math.factorial(2), 0.,
-                      1 / math.factorial(4), 0.,
-                      1 / math.factorial(6), 0.,
-                      1 / math.factorial(8), 0.]
-INV_SINH_TAYLOR_COEFFS = [0., - 1. / 6.,
-                          0., + 7. / 360.,
-                          0., - 31. / 15120.,
-                          0., + 127. / 604800.]
-INV_TANH_TAYLOR_COEFFS = [0., + 1. / 3.,
-                          0., - 1. / 45.,
-                          0., + 2. / 945.,
-                          0., -1. / 4725.]
+# Even Taylor coefficients of cosh(x), sinh(x) / x, x / sinh(x) and
+# x / tanh(x), indexed by the power of x they multiply.
+COSH_C2 = 1 / math.factorial(2)
+COSH_C4 = 1 / math.factorial(4)
+COSH_C6 = 1 / math.factorial(6)
+COSH_C8 = 1 / math.factorial(8)
+SINH_C2 = 1 / math.factorial(3)
+SINH_C4 = 1 / math.factorial(5)
+SINH_C6 = 1 / math.factorial(7)
+SINH_C8 = 1 / math.factorial(9)
+INV_SINH_C2 = - 1. / 6.
+INV_SINH_C4 = + 7. / 360.
+INV_SINH_C6 = - 31. / 15120.
+INV_SINH_C8 = + 127. / 604800.
+INV_TANH_C2 = + 1. / 3.
+INV_TANH_C4 = - 1. / 45.
+INV_TANH_C6 = + 2. / 945.
+INV_TANH_C8 = - 1. / 4725.
 
 EPSILON = 1e-6
 
 
+def _regularize(point, embedding_metric):
+    """Project points of Minkowski space onto the hyperboloid.
+
+    Parameters
+    ----------
+    point : array-like, shape=[n_samples, dimension + 1]
+        Point in Minkowski space.
+    embedding_metric : MinkowskiMetric
+        Metric of the embedding Minkowski space.
+
+    Returns
+    -------
+    projected_point : array-like, shape=[n_samples, dimension + 1]
+        Point divided by its Minkowski norm, or zero where that norm
+        is zero.
+    """
+    point = gs.to_ndarray(point, to_ndim=2)
+
+    sq_norm = embedding_metric.squared_norm(point)
+    real_norm = gs.sqrt(gs.abs(sq_norm))
+
+    mask_0 = gs.isclose(real_norm, 0.)
+    mask_not_0 = ~mask_0
+    mask_0_float = gs.cast(mask_0, gs.float32)
+    mask_not_0_float = gs.cast(mask_not_0, gs.float32)
+
+    # This avoids dividing by 0.
+    projected_point = mask_not_0_float * (
+        point / (real_norm + mask_0_float))
+    return projected_point
+
+
 class Hyperbolic(EmbeddedManifold):
     """Class for the n-dimensional hyperbolic space.
 
@@ -149,16 +180,14 @@ class Hyperbolic(EmbeddedManifold):
         """
         point = gs.to_ndarray(point, to_ndim=2)
         _, point_dim = point.shape
-        if point_dim is not self.dimension + 1:
-            if point_dim is self.dimension and self.coords_type == 'intrinsic':
+        if point_dim != self.dimension + 1:
+            if point_dim == self.dimension and self.coords_type == 'intrinsic':
                 return gs.array([[True]])
             else:
                 return gs.array([[False]])
 
         sq_norm = self.embedding_metric.squared_norm(point)
-        euclidean_sq_norm = gs.linalg.norm(point, axis=-1) ** 2
-        euclidean_sq_norm = gs.to_ndarray(euclidean_sq_norm,
-                                          to_ndim=2, axis=1)
+        euclidean_sq_norm = gs.sum(point * point, axis=-1, keepdims=True)
         diff = gs.abs(sq_norm + 1)
         belongs = diff < tolerance * euclidean_sq_norm
         return belongs
@@ -226,19 +255,7 @@ class Hyperbolic(EmbeddedManifold):
             Point in hyperbolic space in canonical representation
             in extrinsic coordinates.
         """
-        point = gs.to_ndarray(point, to_ndim=2)
-
-        sq_norm = self.embedding_metric.squared_norm(point)
-        real_norm = gs.sqrt(gs.abs(sq_norm))
-
-        mask_0 = gs.isclose(real_norm, 0.)
-        mask_not_0 = ~mask_0
-        mask_not_0_float = gs.cast(mask_not_0, gs.float32)
-        projected_point = point
-
-        projected_point = mask_not_0_float * (
-            point / real_norm)
-        return projected_point
+        return _regularize(point, self.embedding_metric)
 
     def projection_to_tangent_space(self, vector, base_point):
         """Project a vector to a tangent space of the hyperbolic space.
@@ -267,7 +284,7 @@ class Hyperbolic(EmbeddedManifold):
                                                          vector)
 
         coef = inner_prod / sq_norm
-        tangent_vec = vector - gs.einsum('ni,nj->nj', coef, base_point)
+        tangent_vec = vector - coef * base_point
         return tangent_vec
 
     @staticmethod
@@ -310,7 +327,8 @@ class Hyperbolic(EmbeddedManifold):
         """
         point_intrinsic = gs.to_ndarray(point_intrinsic, to_ndim=2)
 
-        coord_0 = gs.sqrt(1. + gs.linalg.norm(point_intrinsic, axis=-1) ** 2)
+        coord_0 = gs.sqrt(
+            1. + gs.einsum('ni,ni->n', point_intrinsic, point_intrinsic))
         coord_0 = gs.to_ndarray(coord_0, to_ndim=2, axis=1)
 
         point_extrinsic = gs.concatenate([coord_0, point_intrinsic], axis=-1)
@@ -639,7 +657,6 @@ class HyperbolicMetric(RiemannianMetric):
             sq_norm_tangent_vec = self.embedding_metric.squared_norm(
                 tangent_vec)
             sq_norm_tangent_vec = gs.clip(sq_norm_tangent_vec, 0, math.inf)
-            norm_tangent_vec = gs.sqrt(sq_norm_tangent_vec)
 
             mask_0 = gs.isclose(sq_norm_tangent_vec, 0.)
             mask_0 = gs.to_ndarray(mask_0, to_ndim=1)
@@ -648,31 +665,30 @@ class HyperbolicMetric(RiemannianMetric):
             mask_0_float = gs.cast(mask_0, gs.float32)
             mask_else_float = gs.cast(mask_else, gs.float32)
 
-            coef_1 = gs.zeros_like(norm_tangent_vec)
-            coef_2 = gs.zeros_like(norm_tangent_vec)
+            coef_1 = gs.zeros_like(sq_norm_tangent_vec)
+            coef_2 = gs.zeros_like(sq_norm_tangent_vec)
 
+            # Taylor expansions evaluated with Horner's scheme directly in
+            # the squared norm, which needs no square root.
             coef_1 += mask_0_float * (
-                1. + COSH_TAYLOR_COEFFS[2] * norm_tangent_vec ** 2
-                + COSH_TAYLOR_COEFFS[4] * norm_tangent_vec ** 4
-                + COSH_TAYLOR_COEFFS[6] * norm_tangent_vec ** 6
-                + COSH_TAYLOR_COEFFS[8] * norm_tangent_vec ** 8)
+                (((COSH_C8 * sq_norm_tangent_vec
+                   + COSH_C6) * sq_norm_tangent_vec
+                  + COSH_C4) * sq_norm_tangent_vec
+                 + COSH_C2) * sq_norm_tangent_vec + 1.)
             coef_2 += mask_0_float * (
-                1. + SINH_TAYLOR_COEFFS[3] * norm_tangent_vec ** 2
-                + SINH_TAYLOR_COEFFS[5] * norm_tangent_vec ** 4
-                + SINH_TAYLOR_COEFFS[7] * norm_tangent_vec ** 6
-                + SINH_TAYLOR_COEFFS[9] * norm_tangent_vec ** 8)
-            # This avoids dividing by 0.
-            norm_tangent_vec += mask_0_float * 1.0
+                (((SINH_C8 * sq_norm_tangent_vec
+                   + SINH_C6) * sq_norm_tangent_vec
+                  + SINH_C4) * sq_norm_tangent_vec
+                 + SINH_C2) * sq_norm_tangent_vec + 1.)
+            # This avoids taking the square root of 0 and dividing by 0.
+            norm_tangent_vec = gs.sqrt(sq_norm_tangent_vec + mask_0_float)
             coef_1 += mask_else_float * (gs.cosh(norm_tangent_vec))
             coef_2 += mask_else_float * (
                 (gs.sinh(norm_tangent_vec) / (norm_tangent_vec)))
 
-            exp = (
-                gs.einsum('ni,nj->nj', coef_1, base_point)
-                + gs.einsum('ni,nj->nj', coef_2, tangent_vec))
+            exp = coef_1 * base_point + coef_2 * tangent_vec
 
-            hyperbolic_space = Hyperbolic(dimension=self.dimension)
-            exp = hyperbolic_space.regularize(exp)
+            exp = _regularize(exp, self.embedding_metric)
             return exp
 
         elif self.coords_type == 'ball':
@@ -731,9 +747,7 @@ class HyperbolicMetric(RiemannianMetric):
 
         if self.coords_type == 'extrinsic':
 
-            angle = self.dist(base_point, point) / self.scale
-            angle = gs.to_ndarray(angle, to_ndim=1)
-            angle = gs.to_ndarray(angle, to_ndim=2)
+            angle = self._angle(base_point, point)
 
             mask_0 = gs.isclose(angle, 0.)
             mask_else = ~mask_0
@@ -744,16 +758,18 @@ class HyperbolicMetric(RiemannianMetric):
             coef_1 = gs.zeros_like(angle)
             coef_2 = gs.zeros_like(angle)
 
+            # Taylor expansions evaluated with Horner's scheme in angle ** 2.
+            angle_2 = angle * angle
             coef_1 += mask_0_float * (
-                1. + INV_SINH_TAYLOR_COEFFS[1] * angle ** 2
-                + INV_SINH_TAYLOR_COEFFS[3] * angle ** 4
-                + INV_SINH_TAYLOR_COEFFS[5] * angle ** 6
-                + INV_SINH_TAYLOR_COEFFS[7] * angle ** 8)
+                (((INV_SINH_C8 * angle_2
+                   + INV_SINH_C6) * angle_2
+                  + INV_SINH_C4) * angle_2
+                 + INV_SINH_C2) * angle_2 + 1.)
             coef_2 += mask_0_float * (
-                1. + INV_TANH_TAYLOR_COEFFS[1] * angle ** 2
-                + INV_TANH_TAYLOR_COEFFS[3] * angle ** 4
-                + INV_TANH_TAYLOR_COEFFS[5] * angle ** 6
-                + INV_TANH_TAYLOR_COEFFS[7] * angle ** 8)
+                (((INV_TANH_C8 * angle_2
+                   + INV_TANH_C6) * angle_2
+                  + INV_TANH_C4) * angle_2
+                 + INV_TANH_C2) * angle_2 + 1.)
 
             # This avoids dividing by 0.
             angle += mask_0_float * 1.
@@ -761,8 +777,7 @@ class HyperbolicMetric(RiemannianMetric):
             coef_1 += mask_else_float * (angle / gs.sinh(angle))
             coef_2 += mask_else_float * (angle / gs.tanh(angle))
 
-            log = (gs.einsum('ni,nj->nj', coef_1, point) -
-                   gs.einsum('ni,nj->nj', coef_2, base_point))
+            log = coef_1 * point - coef_2 * base_point
             return log
 
         elif self.coords_type == 'ball':
@@ -834,6 +849,32 @@ class HyperbolicMetric(RiemannianMetric):
 
         return mobius_add
 
+    def _angle(self, point_a, point_b):
+        """Compute the hyperbolic angle between two points.
+
+        This is the geodesic distance in extrinsic coordinates before
+        scaling, shared by dist and log.
+
+        Parameters
+        ----------
+        point_a : array-like, shape=[n_samples, dimension + 1]
+            First point in hyperbolic space.
+        point_b : array-like, shape=[n_samples, dimension + 1]
+            Second point in hyperbolic space.
+
+        Returns
+        -------
+        angle : array-like, shape=[n_samples, 1]
+            Angle between the two points.
+        """
+        sq_norm_a = self.embedding_metric.squared_norm(point_a)
+        sq_norm_b = self.embedding_metric.squared_norm(point_b)
+        inner_prod = self.embedding_metric.inner_product(point_a, point_b)
+
+        cosh_angle = - inner_prod / gs.sqrt(sq_norm_a * sq_norm_b)
+        cosh_angle = gs.clip(cosh_angle, 1.0, 1e24)
+        return gs.arccosh(cosh_angle)
+
     def dist(self, point_a, point_b):
         """Compute the geodesic distance between two points.
 
@@ -851,14 +892,7 @@ class HyperbolicMetric(RiemannianMetric):
         """
         if self.coords_type == 'extrinsic':
 
-            sq_norm_a = self.embedding_metric.squared_norm(point_a)
-            sq_norm_b = self.embedding_metric.squared_norm(point_b)
-            inner_prod = self.embedding_metric.inner_product(point_a, point_b)
-
-            cosh_angle = - inner_prod / gs.sqrt(sq_norm_a * sq_norm_b)
-            cosh_angle = gs.clip(cosh_angle, 1.0, 1e24)
-
-            dist = gs.arccosh(cosh_angle)
+            dist = self._angle(point_a, point_b)
             dist *= self.scale
             return dist
 
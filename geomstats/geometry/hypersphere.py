@@ -431,19 +431,23 @@ class HypersphereMetric(RiemannianMetric):
         # TODO(nina): Decide on metric.space or space.metric
         #  for the hypersphere
         # TODO(nina): Raise error when vector is not tangent
-        n_base_points, extrinsic_dim = base_point.shape
+        n_base_points, _ = base_point.shape
         n_tangent_vecs, _ = tangent_vec.shape
-
-        hypersphere = Hypersphere(dimension=extrinsic_dim - 1)
-        proj_tangent_vec = hypersphere.projection_to_tangent_space(
-            tangent_vec, base_point)
+        if n_tangent_vecs != n_base_points and 1 not in (
+                n_tangent_vecs, n_base_points):
+            raise ValueError('Shape mismatch in exp.')
+
+        # The base point has unit norm, so the projection to its tangent
+        # space needs neither a Hypersphere instance nor a division.
+        inner_prod = gs.sum(base_point * tangent_vec, axis=-1, keepdims=True)
+        proj_tangent_vec = tangent_vec - inner_prod * base_point
         norm_tangent_vec = self.embedding_metric.norm(proj_tangent_vec)
 
         mask_0 = gs.isclose(norm_tangent_vec, 0.)
         mask_non0 = ~mask_0
 
-        coef_1 = gs.zeros((n_tangent_vecs, 1))
-        coef_2 = gs.zeros((n_tangent_vecs, 1))
+        coef_1 = gs.zeros_like(norm_tangent_vec)
+        coef_2 = gs.zeros_like(norm_tangent_vec)
         norm2 = norm_tangent_vec[mask_0]**2
         norm4 = norm2**2
         norm6 = norm2**3
@@ -454,21 +458,7 @@ class HypersphereMetric(RiemannianMetric):
         coef_2[mask_non0] = gs.sin(norm_tangent_vec[mask_non0]) / \
             norm_tangent_vec[mask_non0]
 
-        n_coef_1 = n_tangent_vecs
-        if n_coef_1 != n_base_points:
-            if n_coef_1 == 1:
-                coef_1 = gs.squeeze(coef_1, axis=0)
-                einsum_str = 'i,nj->nj'
-            elif n_base_points == 1:
-                base_point = gs.squeeze(base_point, axis=0)
-                einsum_str = 'ni,j->nj'
-            else:
-                raise ValueError('Shape mismatch in einsum.')
-        else:
-            einsum_str = 'ni,nj->nj'
-
-        exp = (gs.einsum(einsum_str, coef_1, base_point)
-               + gs.einsum('ni,nj->nj', coef_2, proj_tangent_vec))
+        exp = coef_1 * base_point + coef_2 * proj_tangent_vec
 
         return exp
 
@@ -88,6 +88,33 @@ class MinkowskiMetric(RiemannianMetric):
 
         return inner_prod_mat
 
+    def inner_product(self, tangent_vec_a, tangent_vec_b, base_point=None):
+        """Compute the Minkowski inner product of two tangent vectors.
+
+        The metric is diagonal, so the product is computed elementwise
+        instead of through the inner product matrix.
+
+        Parameters
+        ----------
+        tangent_vec_a: array-like, shape=[n_samples, dimension]
+                                   or shape=[1, dimension]
+        tangent_vec_b: array-like, shape=[n_samples, dimension]
+                                   or shape=[1, dimension]
+        base_point: array-like, shape=[n_samples, dimension]
+                                or shape=[1, dimension]
+
+        Returns
+        -------
+        inner_prod: array-like, shape=[n_samples, 1]
+        """
+        tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=2)
+        tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=2)
+
+        inner_prod = (
+            gs.sum(tangent_vec_a * tangent_vec_b, axis=-1, keepdims=True)
+            - 2. * tangent_vec_a[:, :1] * tangent_vec_b[:, :1])
+        return inner_prod
+
     def exp(self, tangent_vec, base_point):
         """Compute the Riemannian exponential of `tangent_vec` at `base_point`.
 
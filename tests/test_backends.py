@@ -201,6 +201,47 @@ class TestBackends(geomstats.tests.TestCase):
 
         self.assertAllClose(result, expected)
 
+    def test_solve(self):
+        mat_a = [[2., 0., 0.],
+                 [0., 3., 0.],
+                 [7., 0., 4.]]
+        mat_b = [[1., 0., 2.],
+                 [0., 3., 0.],
+                 [0., 0., 1.]]
+        gs_mat_a = gs.array(mat_a)
+        gs_mat_b = gs.array(mat_b)
+        np_mat_a = np.array(mat_a)
+        np_mat_b = np.array(mat_b)
+
+        gs_result = gs.linalg.solve(gs_mat_a, gs_mat_b)
+        np_result = np.linalg.solve(np_mat_a, np_mat_b)
+
+        self.assertAllCloseToNp(gs_result, np_result)
+
+    @geomstats.tests.np_and_tf_only
+    def test_solve_vectorization(self):
+        mat_a = [[2., 0., 0.],
+                 [0., 3., 0.],
+                 [7., 0., 4.]]
+        mat_b = [[1., 0., 2.],
+                 [0., 3., 0.],
+                 [0., 0., 1.]]
+        mat_c = [[1., 4., 2.],
+                 [4., 3., 4.],
+                 [0., 0., 4.]]
+        gs_mat_a = gs.array(mat_a)
+        gs_mats_b_c = gs.array([mat_b, mat_c])
+        np_mat_a = np.array(mat_a)
+        np_mats_b_c = np.array([mat_b, mat_c])
+
+        gs_result = gs.linalg.solve(gs_mat_a, gs_mats_b_c)
+        np_result = np.linalg.solve(np_mat_a, np_mats_b_c)
+        self.assertAllCloseToNp(gs_result, np_result)
+
+        gs_result = gs.linalg.solve(gs_mats_b_c, gs_mat_a)
+        np_result = np.linalg.solve(np_mats_b_c, np_mat_a)
+        self.assertAllCloseToNp(gs_result, np_result)
+
     @geomstats.tests.pytorch_only
     def test_sampling_choice(self):
         res = gs.random.choice(10, (5, 1, 3))
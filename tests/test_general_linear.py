@@ -134,3 +134,96 @@ class TestGeneralLinearMethods(geomstats.tests.TestCase):
         result = self.group.exp(self.group.log(point))
         expected = point
         self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_and_tf_only
+    def test_orbit_base_point(self):
+        base_point = gs.array([
+            [2., 0.],
+            [0., 3.]])
+        point = gs.array([
+            [2. * gs.exp(2.), 0.],
+            [0., 3. * gs.exp(4.)]])
+
+        path = GeneralLinear(2).orbit(point, base_point)
+        time = gs.linspace(0., 1., 3)
+
+        result = path(time)
+        expected = gs.array([
+            base_point,
+            [[2. * gs.exp(1.), 0.], [0., 3. * gs.exp(2.)]],
+            point])
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_and_tf_only
+    def test_orbit_non_symmetric(self):
+        angle = gs.pi / 3.
+        point = gs.array([
+            [gs.cos(angle), - gs.sin(angle)],
+            [gs.sin(angle), gs.cos(angle)]])
+        half_angle = angle / 2.
+        half_point = gs.array([
+            [gs.cos(half_angle), - gs.sin(half_angle)],
+            [gs.sin(half_angle), gs.cos(half_angle)]])
+        idty = GeneralLinear(2).identity()
+
+        path = GeneralLinear(2).orbit(point)
+        time = gs.linspace(0., 1., 3)
+
+        result = path(time)
+        expected = gs.array([idty, half_point, point])
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_and_tf_only
+    def test_orbit_vectorization(self):
+        point = gs.array([
+            [[gs.exp(4.), 0.],
+             [0., gs.exp(2.)]],
+            [[gs.exp(2.), 0.],
+             [0., gs.exp(6.)]]])
+        sqrt = gs.array([
+            [[gs.exp(2.), 0.],
+             [0., gs.exp(1.)]],
+            [[gs.exp(1.), 0.],
+             [0., gs.exp(3.)]]])
+        idty = GeneralLinear(2).identity()
+
+        path = GeneralLinear(2).orbit(point)
+        time = gs.linspace(0., 1., 3)
+
+        result = path(time)
+        expected = gs.array([
+            [idty, sqrt[0], point[0]],
+            [idty, sqrt[1], point[1]]])
+        self.assertAllClose(result, expected)
+
+        base_point = gs.array([
+            [[2., 0.],
+             [0., 3.]],
+            [[4., 0.],
+             [0., 5.]]])
+        path = GeneralLinear(2).orbit(
+            GeneralLinear.mul(base_point, point), base_point)
+        for n_times in [2, 5]:
+            time = gs.linspace(0., 1., n_times)
+            result = path(time)
+            expected = GeneralLinear.mul(
+                gs.expand_dims(base_point, -3),
+                GeneralLinear(2).orbit(point)(time))
+            self.assertAllClose(result, expected)
+            self.assertAllClose(result[:, 0], base_point)
+            self.assertAllClose(
+                result[:, -1], GeneralLinear.mul(base_point, point))
+
+    @geomstats.tests.np_and_tf_only
+    def test_orbit_nearly_symmetric(self):
+        lie_algebra_vec = gs.array([
+            [6., 4e-6],
+            [-4e-6, 1.]])
+        point = gs.linalg.expm(lie_algebra_vec)
+
+        path = GeneralLinear(2).orbit(point)
+        time = gs.array([0., 1.])
+
+        result = path(time)[-1]
+        expected = point
+        self.assertAllClose(result, expected, rtol=1e-10, atol=1e-10)
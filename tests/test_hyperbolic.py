@@ -36,6 +36,21 @@ class TestHyperbolicMethods(geomstats.tests.TestCase):
 
         self.assertAllClose(gs.shape(result), (1, self.dimension + 1))
 
+    def test_random_uniform_vectorization(self):
+        points = self.space.random_uniform(n_samples=self.n_samples)
+        self.assertAllClose(
+            gs.shape(points), (self.n_samples, self.dimension + 1))
+
+        result = self.space.belongs(points)
+        expected = gs.array([[True]] * self.n_samples)
+        self.assertAllClose(result, expected)
+
+    def test_regularize_null_norm(self):
+        point = gs.array([[1., 1., 0., 0.]])
+        result = self.space.regularize(point)
+        expected = gs.zeros((1, self.dimension + 1))
+        self.assertAllClose(result, expected)
+
     def test_intrinsic_and_extrinsic_coords(self):
         """
         Test that the composition of
@@ -154,6 +154,28 @@ class TestHypersphereMethods(geomstats.tests.TestCase):
 
         self.assertAllClose(result, expected)
 
+    @geomstats.tests.np_and_pytorch_only
+    def test_exp_shape_mismatch(self):
+        base_points = self.space.random_uniform(n_samples=3)
+        tangent_vecs = self.space.projection_to_tangent_space(
+            vector=gs.random.rand(4, self.dimension + 1),
+            base_point=base_points[0])
+
+        self.assertRaises(
+            ValueError, self.metric.exp, tangent_vecs, base_points)
+
+    @geomstats.tests.np_and_pytorch_only
+    def test_exp_one_tangent_vec_n_base_points(self):
+        n_samples = self.n_samples
+        base_points = self.space.random_uniform(n_samples=n_samples)
+        one_vec = gs.random.rand(1, self.dimension + 1)
+
+        result = self.metric.exp(one_vec, base_points)
+        expected = gs.vstack([
+            self.metric.exp(one_vec, base_points[i])
+            for i in range(n_samples)])
+        self.assertAllClose(result, expected)
+
     @geomstats.tests.np_and_pytorch_only
     def test_exp_vectorization(self):
         n_samples = self.n_samples